@@ -6,19 +6,156 @@ API Wrapper for PlayStation Network using PSNAWP.
 """
 
 import asyncio
+import hashlib
 import logging
+import time
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Self
 
 from psnawp_api import PSNAWP  # noqa: E402
+from psnawp_api.core.psnawp_exceptions import (
+    PSNAWPAuthenticationError,
+    PSNAWPBadRequestError,
+    PSNAWPTooManyRequestsError,
+    PSNAWPUnauthorizedError,
+)
 from psnawp_api.models.user import User  # noqa: E402
 from pyrate_limiter import Duration, Rate  # noqa: E402
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 _LOG = logging.getLogger(__name__)
 
+# Connection pool / retry policy for the long-lived PSN requests.Session
+_POOL_CONNECTIONS = 2
+_POOL_MAXSIZE = 8
+# 429 is left to PSNAWP and the token bucket, which would otherwise be bypassed
+# by transport-level resends. Retry-After is ignored for the codes below (503
+# carries it during PSN maintenance) so urllib3 never sleeps in the executor.
+_RETRY_STATUS_CODES = (502, 503, 504)
+# (connect, read) seconds per attempt. psnawp sends no timeout, so without this a
+# stalled socket would hang its executor thread forever. With the retries below a
+# single call is still bounded, but can hold its thread for up to about a minute.
+_REQUEST_TIMEOUT = (3.05, 10)
 
-@dataclass
+# Seconds one PSN request may run in the executor before its await is abandoned.
+# Only the network call is timed; waiting for a rate-limit token is not a failure.
+CALL_TIMEOUT = 15
+
+# PSN allows 300 requests per 15 minutes
+_RATE_LIMIT_REQUESTS = 300
+_RATE_LIMIT_WINDOW = 15 * 60
+# After a 429 every account pauses this long (seconds) before the next request
+_RATE_LIMIT_PENALTY = 60
+
+# Registered consoles change rarely, so the device list is refreshed hourly
+_DEVICES_CACHE_TTL = 60 * 60
+
+# PSNAWP clients shared across reconnects and accounts, keyed by NPSSO fingerprint
+_PSNAWP_CLIENTS: dict[str, PSNAWP] = {}
+
+# Errors meaning the client's tokens are no longer usable; the NPSSO must be
+# exchanged again (a rejected refresh token comes back as 400 or 401)
+_AUTH_FAILURES = (
+    PSNAWPAuthenticationError,
+    PSNAWPBadRequestError,
+    PSNAWPUnauthorizedError,
+)
+
+# Console types reported in registered_platforms, in reporting order
+_VALID_PLATFORMS = ("PS5", "PS4")
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies _REQUEST_TIMEOUT to requests sent without one."""
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ):
+        """Send the request, defaulting the timeout when the caller gave none."""
+        if timeout is None:
+            timeout = _REQUEST_TIMEOUT
+        return super().send(
+            request,
+            stream=stream,
+            timeout=timeout,
+            verify=verify,
+            cert=cert,
+            proxies=proxies,
+        )
+
+
+class _TokenBucket:
+    """Monotonic-clock token bucket used to pace outbound PSN requests.
+
+    Use ``await bucket.acquire()`` or ``async with bucket:`` before each request.
+    """
+
+    __slots__ = ("cap", "last", "rate", "tokens")
+
+    def __init__(self, cap: float, rate: float) -> None:
+        """
+        Create a full bucket.
+
+        :param cap: Maximum number of tokens (burst size).
+        :param rate: Refill rate in tokens per second.
+        """
+        self.cap = cap
+        self.rate = rate
+        self.tokens = cap
+        self.last = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self.tokens = min(self.cap, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+
+    async def acquire(self, cost: float = 1) -> None:
+        """
+        Wait until ``cost`` tokens are available, then take them.
+
+        :param cost: Number of tokens the request consumes.
+        """
+        self._refill()
+        while self.tokens < cost:
+            await asyncio.sleep((cost - self.tokens) / self.rate)
+            self._refill()
+        self.tokens -= cost
+
+    def penalize(self, seconds: float = _RATE_LIMIT_PENALTY) -> None:
+        """
+        Empty the bucket after PSN answered 429 Too Many Requests.
+
+        Tokens go negative by ``seconds`` worth of refill, so no request is sent
+        until that much time has passed, however full the bucket was.
+
+        :param seconds: How long request sending should pause.
+        """
+        self._refill()
+        self.tokens = min(self.tokens, 0.0) - seconds * self.rate
+
+    async def __aenter__(self) -> Self:
+        """Acquire one token for the request in the ``async with`` block."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Penalize the bucket if the request was rate limited."""
+        if exc_type is not None and issubclass(exc_type, PSNAWPTooManyRequestsError):
+            self.penalize()
+
+
+# One request budget for every configured account, rather than one per instance
+_SHARED_RATE = Rate(_RATE_LIMIT_REQUESTS, Duration.SECOND * _RATE_LIMIT_WINDOW)
+_SHARED_BUCKET = _TokenBucket(
+    _RATE_LIMIT_REQUESTS, _RATE_LIMIT_REQUESTS / _RATE_LIMIT_WINDOW
+)
+
+
+@dataclass(slots=True)
 class PlayStationNetworkData:
     """Dataclass representing data retrieved from the PlayStation Network api."""
 
@@ -37,14 +174,94 @@ class PlayStationNetwork:
     :raises PSNAWPAuthenticationError: If npsso code is expired or is incorrect.
     """
 
-    def __init__(self, npsso: str, loop: asyncio.AbstractEventLoop) -> None:
-        """Initialize PlayStationNetwork with NPSSO token."""
-        self.rate = Rate(300, Duration.MINUTE * 15)
-        self.psn = PSNAWP(npsso, rate_limit=self.rate)
+    def __init__(
+        self, npsso: str, loop: asyncio.AbstractEventLoop, *, pooled: bool = True
+    ) -> None:
+        """
+        Initialize PlayStationNetwork with NPSSO token.
+
+        :param npsso: NPSSO token used to authenticate.
+        :param loop: Event loop used to run blocking PSN requests in the executor.
+        :param pooled: Reuse the shared client for this token. Pass False for
+            one-off validation (e.g. setup) so its client is closed with this object.
+        """
+        self.rate = _SHARED_RATE
+        self._bucket = _SHARED_BUCKET
+        self._pool_key: str | None = _npsso_fingerprint(npsso) if pooled else None
+        self.psn = (
+            self._get_client(npsso, self.rate)
+            if pooled
+            else self._new_client(npsso, self.rate)
+        )
         self.client = self.psn.me()
         self.user: User | None = None
+        self._username: str | None = None
+        self._account_id: str | None = None
+        self._platforms_cache: list[str] | None = None
+        self._platforms_cached_at = 0.0
         self.data: PlayStationNetworkData | None = None
         self.loop = loop
+        self._closed = False
+
+    @classmethod
+    def _get_client(cls, npsso: str, rate: Rate) -> PSNAWP:
+        """
+        Return the pooled PSNAWP client for this NPSSO token, creating it if needed.
+
+        Reusing the client across reconnects (e.g. Remote standby cycles) keeps its
+        access token and warm connection pool instead of re-authenticating.
+        """
+        key = _npsso_fingerprint(npsso)
+        psn = _PSNAWP_CLIENTS.get(key)
+        if psn is None:
+            psn = cls._new_client(npsso, rate)
+            _PSNAWP_CLIENTS[key] = psn
+        return psn
+
+    @classmethod
+    def _new_client(cls, npsso: str, rate: Rate) -> PSNAWP:
+        """Create a PSNAWP client with the keep-alive session policy applied."""
+        psn = PSNAWP(npsso, rate_limit=rate)
+        cls._configure_session(psn.authenticator.request_builder.session)
+        return psn
+
+    def _evict(self) -> None:
+        """
+        Drop this client from the pool after PSN rejected its tokens.
+
+        The next connect then exchanges the NPSSO again instead of reusing a client
+        whose refresh token no longer works. The session is closed by close().
+        """
+        if self._pool_key is None:
+            return
+        if _PSNAWP_CLIENTS.get(self._pool_key) is self.psn:
+            del _PSNAWP_CLIENTS[self._pool_key]
+        self._pool_key = None
+
+    @staticmethod
+    def _configure_session(session: Session) -> None:
+        """
+        Mount a keep-alive connection pool with timeouts and retries on the session.
+
+        The session lives as long as this object, so every poll reuses the pooled
+        TCP+TLS connections instead of paying a new handshake. Retries are not
+        raised on status so PSNAWP still maps the final response to its own errors.
+        Read timeouts are not retried, so one stalled response ends the attempt.
+        """
+        adapter = _TimeoutHTTPAdapter(
+            pool_connections=_POOL_CONNECTIONS,
+            pool_maxsize=_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                read=0,
+                backoff_factor=0.3,
+                status_forcelist=_RETRY_STATUS_CODES,
+                respect_retry_after_header=False,
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
 
     def validate_connection(self):
         """Validate the PSN connection by fetching the current user."""
@@ -53,21 +270,24 @@ class PlayStationNetwork:
     def get_user(self):
         """Get the PSN user object."""
         self.user = self.psn.user(online_id="me")
+        # Identity never changes for a session, so only presence is read per poll
+        self._username = self.user.online_id
+        self._account_id = self.user.account_id
         return self.user
 
     def close(self):
-        """Close the PSN connection and cleanup resources."""
-        try:
-            if hasattr(self.psn, "authenticator") and hasattr(
-                self.psn.authenticator, "request_builder"
-            ):
-                # Close the requests.Session to release connection pool resources
-                session: Session = self.psn.authenticator.request_builder.session
-                if session:
-                    session.close()
-                    _LOG.debug("PSN session closed successfully")
-        except Exception as ex:  # pylint: disable=broad-exception-caught
-            _LOG.debug("Error during PSN cleanup: %s", ex)
+        """
+        Release this handle. Safe to call more than once.
+
+        A pooled PSNAWP session stays open so a reconnect can reuse it; those are
+        closed by close_all_clients() when the driver shuts down. Unpooled or
+        evicted clients are closed here.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._pool_key is None:
+            _close_session(self.psn)
 
     def get_title_stats(self, limit: int = 10, offset: int = 0) -> list:
         """
@@ -80,40 +300,102 @@ class PlayStationNetwork:
         iterator = self.client.title_stats(limit=limit, offset=offset, page_size=limit)
         return list(iterator)
 
-    def get_data(self):
-        """Get the PlayStation Network data."""
-        data: PlayStationNetworkData = PlayStationNetworkData(
-            {}, "", "", False, {}, {}, []
-        )
+    async def get_data_async(self) -> PlayStationNetworkData:
+        """
+        Get the PlayStation Network data without blocking the event loop.
 
+        Each blocking PSN request is dispatched to the default executor so the
+        driver keeps servicing other devices while the HTTPS round-trips are in flight.
+        """
         if not self.user:
-            self.user = self.get_user()
-
-        devices = self.client.get_account_devices()
-        for device in devices:
-            if (
-                device.get("deviceType") in ["PS5", "PS4"]
-                and device.get("deviceType") not in data.registered_platforms
-            ):
-                data.registered_platforms.append(device.get("deviceType", ""))
-
-        data.username = self.user.online_id
-        data.account_id = self.user.account_id
-        data.presence = self.user.get_presence()
-
-        data.available = (
-            data.presence.get("basicPresence", {}).get("availability")
-            == "availableToPlay"
-        )
-        data.platform = data.presence.get("basicPresence", {}).get(
-            "primaryPlatformInfo"
+            await self._run_throttled(self.get_user)
+
+        if self._platforms_stale():
+            # The device list and presence are independent, so fetch them together
+            devices, presence = await asyncio.gather(
+                self._run_throttled(self.client.get_account_devices),
+                self._run_throttled(self.user.get_presence),
+            )
+            self._cache_platforms(devices)
+        else:
+            presence = await self._run_throttled(self.user.get_presence)
+
+        self.data = self._build_data(presence)
+        return self.data
+
+    def _platforms_stale(self) -> bool:
+        """Return True when the registered-platform cache needs refreshing."""
+        return (
+            self._platforms_cache is None
+            or time.monotonic() - self._platforms_cached_at > _DEVICES_CACHE_TTL
         )
-        game_title_info_list = data.presence.get("basicPresence", {}).get(
-            "gameTitleInfoList"
+
+    def _cache_platforms(self, devices: list[dict[str, Any]]) -> None:
+        """Store the console types found in an account-device response."""
+        types = {device.get("deviceType") for device in devices}
+        self._platforms_cache = [t for t in _VALID_PLATFORMS if t in types]
+        self._platforms_cached_at = time.monotonic()
+
+    async def _run_throttled(self, func: Callable[[], Any]) -> Any:
+        """
+        Wait for a rate-limit token, then run a blocking PSN request in the executor.
+
+        :raises TimeoutError: If the request itself takes longer than CALL_TIMEOUT.
+        """
+        async with self._bucket:
+            try:
+                async with asyncio.timeout(CALL_TIMEOUT):
+                    return await self.loop.run_in_executor(None, func)
+            except _AUTH_FAILURES:
+                self._evict()
+                raise
+
+    def _build_data(self, presence: dict[str, Any]) -> PlayStationNetworkData:
+        """Assemble PlayStationNetworkData from the presence response and cached platforms."""
+        data: PlayStationNetworkData = PlayStationNetworkData(
+            {}, "", "", False, {}, {}, []
         )
 
+        data.registered_platforms = list(self._platforms_cache or ())
+
+        data.username = self._username or ""
+        data.account_id = self._account_id or ""
+        data.presence = presence
+
+        basic_presence = presence.get("basicPresence") or {}
+        data.available = basic_presence.get("availability") == "availableToPlay"
+        data.platform = basic_presence.get("primaryPlatformInfo") or {}
+        game_title_info_list = basic_presence.get("gameTitleInfoList")
+
         if game_title_info_list:
             data.title_metadata = game_title_info_list[0]
 
-        self.data = data
-        return self.data
+        return data
+
+
+def _npsso_fingerprint(npsso: str) -> str:
+    """Return a short digest of an NPSSO token so the raw secret isn't kept as a key."""
+    return hashlib.sha256(npsso.encode()).hexdigest()[:16]
+
+
+def _close_session(psn: PSNAWP) -> None:
+    """Close the requests.Session of a PSNAWP client to release its connection pool."""
+    try:
+        psn.authenticator.request_builder.session.close()
+        _LOG.debug("PSN session closed successfully")
+    except Exception as ex:  # pylint: disable=broad-exception-caught
+        _LOG.debug("Error during PSN cleanup: %s", ex)
+
+
+def release_unused_clients(npssos_in_use: Iterable[str]) -> None:
+    """Close and drop pooled PSNAWP clients whose NPSSO no configured device uses."""
+    keep = {_npsso_fingerprint(npsso) for npsso in npssos_in_use}
+    for key in [key for key in _PSNAWP_CLIENTS if key not in keep]:
+        _close_session(_PSNAWP_CLIENTS.pop(key))
+
+
+def close_all_clients() -> None:
+    """Close every pooled PSNAWP session. Called once when the driver shuts down."""
+    for psn in _PSNAWP_CLIENTS.values():
+        _close_session(psn)
+    _PSNAWP_CLIENTS.clear()
@@ -6,9 +6,14 @@ PSN Integration Driver.
 """
 
 import asyncio
+import contextlib
 import logging
 import os
+import signal
+from collections.abc import Coroutine
+from typing import Any
 
+from api import close_all_clients, release_unused_clients
 from const import PSNConfig
 from media_player import PSNMediaPlayer
 from psn import PSNAccount
@@ -18,19 +23,93 @@ from ucapi_framework import BaseConfigManager, BaseIntegrationDriver, get_config
 
 _LOG = logging.getLogger("driver")
 
+# Integration loggers whose level follows UC_LOG_LEVEL
+_LOGGER_NAMES = ("psn", "driver", "setup_flow", "media_player", "sensor")
+
+
+class PSNIntegrationDriver(BaseIntegrationDriver):
+    """Integration driver for PSN accounts with a clean shutdown path."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Create the driver and the set holding its background tasks."""
+        super().__init__(*args, **kwargs)
+        self._background_tasks: set[asyncio.Future] = set()
+
+    def remove_device(self, device_id: str) -> None:
+        """Remove a configured device, keeping a reference to its disconnect task."""
+        device = self._device_instances.pop(device_id, None)
+        if device is None:
+            _LOG.warning("Device %s not found in configured devices", device_id)
+            return
+
+        _LOG.info("Removing device %s", device_id)
+        device.events.remove_all_listeners()
+        self._track_task(self._disconnect_and_release(device))
+
+        for entity_id in self.get_entity_ids_for_device(device_id):
+            self.api.configured_entities.remove(entity_id)
+            self.api.available_entities.remove(entity_id)
+
+    def clear_devices(self) -> None:
+        """Remove all configured devices, disconnecting them concurrently."""
+        _LOG.info("Clearing all configured devices")
+        devices = list(self._device_instances.values())
+        for device in devices:
+            device.events.remove_all_listeners()
+        self._device_instances.clear()
+        self._track_task(self._disconnect_and_release(*devices))
+        self.api.configured_entities.clear()
+        self.api.available_entities.clear()
+
+    async def _disconnect_and_release(self, *devices: PSNAccount) -> None:
+        """Disconnect removed devices, then close pooled clients no device still uses."""
+        await asyncio.gather(
+            *(device.disconnect() for device in devices), return_exceptions=True
+        )
+        release_unused_clients(
+            device.device_config.npsso for device in self._device_instances.values()
+        )
+
+    def _track_task(self, aw: Coroutine[Any, Any, Any] | asyncio.Future) -> None:
+        """Schedule a background awaitable and hold a reference until it finishes."""
+        task = asyncio.ensure_future(aw, loop=self._loop)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+
+    def _on_background_task_done(self, task: asyncio.Future) -> None:
+        """Drop a finished background task and surface its error, if any."""
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            _LOG.warning("Background task failed: %s", task.exception())
+
+    async def on_r2_enter_standby(self) -> None:
+        """Disconnect all PSN accounts concurrently when the Remote enters standby."""
+        _LOG.debug("Enter standby event: disconnecting device(s)")
+        await self._disconnect_all()
+
+    async def shutdown(self) -> None:
+        """Disconnect every PSN account so pooled HTTP connections are released."""
+        _LOG.debug("Shutting down: disconnecting device(s)")
+        await self._disconnect_all()
+        close_all_clients()
+
+    async def _disconnect_all(self) -> None:
+        """Disconnect all devices concurrently; one failure does not stop the others."""
+        await asyncio.gather(
+            *(device.disconnect() for device in self._device_instances.values()),
+            return_exceptions=True,
+        )
+
 
 async def main():
     """Start the Remote Two integration driver."""
     logging.basicConfig()
 
     level = os.getenv("UC_LOG_LEVEL", "DEBUG").upper()
-    logging.getLogger("psn").setLevel(level)
-    logging.getLogger("driver").setLevel(level)
-    logging.getLogger("setup_flow").setLevel(level)
-    logging.getLogger("media_player").setLevel(level)
-    logging.getLogger("sensor").setLevel(level)
+    for name in _LOGGER_NAMES:
+        logging.getLogger(name).setLevel(level)
 
-    driver = BaseIntegrationDriver(
+    driver = PSNIntegrationDriver(
         device_class=PSNAccount,
         entity_classes=[PSNMediaPlayer, PSNSensor, PSNAuthenticationSensor],
         driver_id="psn_driver",
@@ -43,13 +122,35 @@ async def main():
         config_class=PSNConfig,
     )
 
+    # Keep these sequential: register_all_device_instances only fills the
+    # in-memory entity lists (no I/O), and api.init starts serving the Remote,
+    # which may ask for available entities as soon as it connects.
     await driver.register_all_device_instances()
 
     setup_handler = PSNSetupFlow.create_handler(driver)
     await driver.api.init("driver.json", setup_handler)
 
-    await asyncio.Future()
+    # Release PSN sessions before the loop closes instead of leaving sockets
+    # behind when the process is stopped.
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(sig, stop.set)
+
+    await stop.wait()
+    await driver.shutdown()
+
+
+def _install_uvloop() -> None:
+    """Use uvloop as the event loop implementation when it is available."""
+    try:
+        import uvloop  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return
+    uvloop.install()
 
 
 if __name__ == "__main__":
+    _install_uvloop()
     asyncio.run(main())
@@ -6,6 +6,7 @@ PlayStation Network Media Player entity for Unfolded Circle Remote Two.
 """
 
 import logging
+from types import MappingProxyType
 from typing import Any
 
 import playdirector
@@ -20,6 +21,28 @@ from ucapi_framework.entities import MediaPlayerEntity
 
 _LOG = logging.getLogger(__name__)
 
+_DEFAULT_ATTRIBUTES = MappingProxyType(
+    {
+        media_player.Attributes.STATE: media_player.States.UNKNOWN,
+        media_player.Attributes.MEDIA_IMAGE_URL: "",
+        media_player.Attributes.MEDIA_TITLE: "",
+        media_player.Attributes.MEDIA_ARTIST: "",
+    }
+)
+_CONTROL_FEATURES = (media_player.Features.ON_OFF, media_player.Features.TOGGLE)
+
+# PS4 dpad / button commands → RemoteOperation
+_PS4_BUTTON_MAP = {
+    media_player.Commands.CURSOR_UP: playdirector.RemoteOperation.UP,
+    media_player.Commands.CURSOR_DOWN: playdirector.RemoteOperation.DOWN,
+    media_player.Commands.CURSOR_LEFT: playdirector.RemoteOperation.LEFT,
+    media_player.Commands.CURSOR_RIGHT: playdirector.RemoteOperation.RIGHT,
+    media_player.Commands.CURSOR_ENTER: playdirector.RemoteOperation.ENTER,
+    media_player.Commands.BACK: playdirector.RemoteOperation.BACK,
+    media_player.Commands.MENU: playdirector.RemoteOperation.OPTION,
+    media_player.Commands.SETTINGS: playdirector.RemoteOperation.PS,
+}
+
 
 class PSNMediaPlayer(MediaPlayerEntity):
     """Media player entity for PlayStation Network."""
@@ -35,7 +58,7 @@ class PSNMediaPlayer(MediaPlayerEntity):
 
         features = [media_player.Features.BROWSE_MEDIA]
         if device.has_control:
-            features += [media_player.Features.ON_OFF, media_player.Features.TOGGLE]
+            features += _CONTROL_FEATURES
             if device.device_type == "PS5":
                 features += [media_player.Features.HOME]
 
@@ -43,12 +66,7 @@ class PSNMediaPlayer(MediaPlayerEntity):
             entity_id,
             device_config.name,
             features=features,
-            attributes={
-                media_player.Attributes.STATE: media_player.States.UNKNOWN,
-                media_player.Attributes.MEDIA_IMAGE_URL: "",
-                media_player.Attributes.MEDIA_TITLE: "",
-                media_player.Attributes.MEDIA_ARTIST: "",
-            },
+            attributes=dict(_DEFAULT_ATTRIBUTES),
             device_class=media_player.DeviceClasses.SPEAKER,
             options={},
         )
@@ -102,17 +120,6 @@ class PSNMediaPlayer(MediaPlayerEntity):
             await self._device.go_home()
             return StatusCodes.OK
 
-        # PS4 dpad / button commands → RemoteOperation
-        _PS4_BUTTON_MAP = {
-            media_player.Commands.CURSOR_UP: playdirector.RemoteOperation.UP,
-            media_player.Commands.CURSOR_DOWN: playdirector.RemoteOperation.DOWN,
-            media_player.Commands.CURSOR_LEFT: playdirector.RemoteOperation.LEFT,
-            media_player.Commands.CURSOR_RIGHT: playdirector.RemoteOperation.RIGHT,
-            media_player.Commands.CURSOR_ENTER: playdirector.RemoteOperation.ENTER,
-            media_player.Commands.BACK: playdirector.RemoteOperation.BACK,
-            media_player.Commands.MENU: playdirector.RemoteOperation.OPTION,
-            media_player.Commands.SETTINGS: playdirector.RemoteOperation.PS,
-        }
         if cmd in _PS4_BUTTON_MAP and self._device.device_type == "PS4":
             await self._device.send_buttons([_PS4_BUTTON_MAP[cmd]])
             return StatusCodes.OK
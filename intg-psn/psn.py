@@ -7,23 +7,66 @@ This module implements the PlayStation Network communication of the Remote integ
 
 import asyncio
 import logging
+import random
 from asyncio import AbstractEventLoop
 from itertools import islice
 from typing import Any
 
 import playdirector
-from api import PlayStationNetwork, PlayStationNetworkData
+from api import CALL_TIMEOUT, PlayStationNetwork, PlayStationNetworkData
 from const import PSNConfig
-from psnawp_api.core.psnawp_exceptions import PSNAWPAuthenticationError
+from psnawp_api.core.psnawp_exceptions import PSNAWPAuthenticationError, PSNAWPError
 from ucapi import media_player
 from ucapi_framework import BaseIntegrationDriver
-from ucapi_framework.device import DeviceEvents, PollingDevice
+from ucapi_framework.device import (
+    BACKOFF_MAX,
+    BACKOFF_SEC,
+    DeviceEvents,
+    PollingDevice,
+)
 
 _LOG = logging.getLogger(__name__)
 
 ARTWORK_WIDTH = 400
 ARTWORK_HEIGHT = 400
 
+# Title artwork field per console format
+_ARTWORK_KEYS = {"PS5": "conceptIconUrl", "PS4": "npTitleIconUrl"}
+
+# Media player state keyed by (console online, game playing)
+_STATE_TABLE = {
+    (False, False): media_player.States.OFF,
+    (True, False): media_player.States.ON,
+    (True, True): media_player.States.PLAYING,
+}
+
+# Upper bound on PSN polls in flight at once across all configured accounts
+POLL_CONCURRENCY = 4
+_POLL_SEMAPHORE = asyncio.Semaphore(POLL_CONCURRENCY)
+
+# Adaptive polling: presence is checked often only while a game is running
+ACTIVE_POLL_INTERVAL = 30
+IDLE_POLL_INTERVAL = 60
+OFF_POLL_INTERVAL = 180
+# Consecutive OFF polls double the OFF interval up to this ceiling
+OFF_POLL_MAX = 300
+# Back off hard after PSN rejects or fails a request
+ERROR_POLL_INTERVAL = 600
+
+# After a wake command, poll this often (seconds) for up to WAKE_POLL_WINDOW
+# seconds, or until PSN reports the console
+WAKE_POLL_INTERVAL = 10
+WAKE_POLL_WINDOW = 120
+
+# Max random offset (seconds) added to each poll so accounts don't tick together
+POLL_JITTER = 2.0
+
+# Seconds the last good PSN data is served through failed polls before going OFF
+STALE_DATA_MAX = 5 * 60
+
+# Connection attempts before giving up on a transient PSN failure
+CONNECTION_RETRIES = 3
+
 
 class PSNAccount(PollingDevice):
     """Representing a PSN Account using PollingDevice base class."""
@@ -35,16 +78,19 @@ class PSNAccount(PollingDevice):
         config_manager=None,
         driver: BaseIntegrationDriver | None = None,
     ) -> None:
-        """Create instance with 45 second poll interval."""
+        """Create instance polling at the idle interval until a game is playing."""
         super().__init__(
             device_config,
             loop,
-            poll_interval=45,
+            poll_interval=IDLE_POLL_INTERVAL,
             config_manager=config_manager,
             driver=driver,
         )
         self._psn: PlayStationNetwork | None = None
         self._psn_data: PlayStationNetworkData | None = None
+        self._psn_data_at = 0.0
+        # Cached from the latest PSN data for is_on; cleared on disconnect
+        self._is_on = False
 
         # Device state — read by entities via sync_state()
         self.psn_state: media_player.States = media_player.States.UNKNOWN
@@ -53,6 +99,13 @@ class PSNAccount(PollingDevice):
         self.psn_media_image_url: str = ""
         self.psn_authenticated: bool | None = None
         self._total_game_count: int | None = None
+        self._off_streak = 0
+        # Loop time until which OFF polls use WAKE_POLL_INTERVAL after power_on()
+        self._wake_until = 0.0
+        # Set to end the poll loop's current sleep early
+        self._poll_now = asyncio.Event()
+        # Seeded per account so accounts drift onto different offsets
+        self._jitter = random.Random(device_config.identifier)
 
         # playdirector control — credential loaded from config if ps_device is set
         self._pd_credential: playdirector.RemotePlayCredentials | None = None
@@ -76,9 +129,7 @@ class PSNAccount(PollingDevice):
     @property
     def is_on(self) -> bool:
         """Whether the PSN is on or off."""
-        if self._psn and self._psn_data and self._psn_data.available is True:
-            return True
-        return False
+        return self._is_on
 
     @property
     def log_id(self) -> str:
@@ -166,7 +217,23 @@ class PSNAccount(PollingDevice):
                     "[%s] Connected while waiting for lock, skipping", self.log_id
                 )
                 return True
-            return await super().connect()
+            for attempt in range(CONNECTION_RETRIES):
+                if await super().connect():
+                    return True
+                if attempt == CONNECTION_RETRIES - 1:
+                    break
+                # Exponential backoff with jitter so accounts don't retry in lockstep
+                delay = min(BACKOFF_MAX, BACKOFF_SEC * 2**attempt) * (
+                    1 + random.random() * 0.5
+                )
+                _LOG.info(
+                    "[%s] Connect attempt %d failed, retrying in %.1fs",
+                    self.log_id,
+                    attempt + 1,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+            return False
 
     async def establish_connection(self) -> None:
         """Establish connection to PSN - called by base class connect()."""
@@ -233,6 +300,11 @@ class PSNAccount(PollingDevice):
         try:
             await playdirector.wake(device, self._pd_credential)
             _LOG.debug("[%s] power_on: wake sent", self.log_id)
+            # The console is coming up: drop the OFF backoff, poll at the wake
+            # cadence for a while, and cut short the sleep already under way
+            self._off_streak = 0
+            self._wake_until = self._loop.time() + WAKE_POLL_WINDOW
+            self._poll_now.set()
         except Exception as ex:  # pylint: disable=broad-exception-caught
             _LOG.error("[%s] power_on failed: %s", self.log_id, ex)
 
@@ -308,6 +380,61 @@ class PSNAccount(PollingDevice):
                 )
             finally:
                 self._psn = None
+                self._is_on = False
+
+    async def _fetch_limited(self, psn: PlayStationNetwork) -> PlayStationNetworkData:
+        """Fetch PSN data while holding a slot of the cross-account poll limit."""
+        async with _POLL_SEMAPHORE:
+            return await psn.get_data_async()
+
+    async def _poll_loop(self) -> None:
+        """
+        Run the PollingDevice poll loop, waking early when _poll_now is set.
+
+        Same as the base loop, except the sleep between polls also ends when
+        power_on() sets _poll_now, so a woken console is picked up promptly by
+        the one poll path instead of a second, overlapping one.
+        """
+        _LOG.debug("[%s] Poll loop started", self.log_id)
+
+        while not self._stop_polling.is_set():
+            self._poll_now.clear()
+            try:
+                await self.poll_device()
+            except asyncio.CancelledError:
+                break
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                _LOG.error("[%s] Poll error: %s", self.log_id, err)
+
+            waiters = {
+                asyncio.ensure_future(self._stop_polling.wait()),
+                asyncio.ensure_future(self._poll_now.wait()),
+            }
+            try:
+                await asyncio.wait(
+                    waiters,
+                    timeout=self._poll_interval,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
+
+        _LOG.debug("[%s] Poll loop stopped", self.log_id)
+
+    def _next_poll_interval(self) -> int:
+        """Return the poll interval for the current state, backing off while OFF."""
+        if self.psn_state == media_player.States.PLAYING:
+            self._off_streak = 0
+            return ACTIVE_POLL_INTERVAL
+        if self.psn_state == media_player.States.OFF:
+            if self._loop.time() < self._wake_until:
+                # Woken console not on PSN yet; keep checking without backing off
+                return WAKE_POLL_INTERVAL
+            self._off_streak += 1
+            return min(OFF_POLL_MAX, OFF_POLL_INTERVAL * 2 ** (self._off_streak - 1))
+        self._off_streak = 0
+        return IDLE_POLL_INTERVAL
 
     async def poll_device(self) -> None:
         """
@@ -316,67 +443,49 @@ class PSNAccount(PollingDevice):
         This method is called periodically by the PollingDevice base class.
         """
         _LOG.debug("[%s] Polling PSN for updates", self.log_id)
+        started = self._loop.time()
 
         if not self._psn:
             _LOG.warning("[%s] PSN object is None, cannot poll", self.log_id)
             return
 
         try:
-            self._psn_data = await self._loop.run_in_executor(None, self._psn.get_data)
+            data = await self._fetch_limited(self._psn)
 
-            if not self._psn_data:
+            if not data:
                 _LOG.warning(
                     "[%s] PSN data is None, cannot update attributes", self.log_id
                 )
                 return
 
+            self._psn_data = data
+            self._psn_data_at = self._loop.time()
+            self._is_on = data.available is True
             self.psn_authenticated = True
-
-            # Determine state based on PSN data
-            if (
-                self._psn_data.platform
-                and self._psn_data.platform.get("platform", "")
-                and self._psn_data.platform.get("onlineStatus", "") == "online"
-            ):
-                self.psn_state = media_player.States.ON
-                if (
-                    self._psn_data.available
-                    and self._psn_data.title_metadata
-                    and self._psn_data.title_metadata.get("npTitleId") is not None
-                ):
-                    self.psn_state = media_player.States.PLAYING
-            else:
-                self.psn_state = media_player.States.OFF
-
-            self._state = str(self.psn_state)
-
-            # Update title metadata
-            if self._psn_data.title_metadata and self._psn_data.title_metadata.get(
-                "npTitleId"
-            ):
-                self.psn_media_title = (
-                    self._psn_data.title_metadata.get("titleName") or ""
-                )
-                self.psn_media_artist = (
-                    self._psn_data.title_metadata.get("format") or ""
-                )
-
-                title = self._psn_data.title_metadata
-                if title.get("format", "") == "PS5":
-                    self.psn_media_image_url = title.get("conceptIconUrl") or ""
-                elif title.get("format", "") == "PS4":
-                    self.psn_media_image_url = title.get("npTitleIconUrl") or ""
-                else:
-                    self.psn_media_image_url = ""
-            else:
-                # Clear metadata when not playing
-                self.psn_media_title = ""
-                self.psn_media_artist = ""
-                self.psn_media_image_url = ""
+            self._apply_data(data)
+
+            # PollingDevice sleeps _poll_interval after this returns, so subtract
+            # the fetch time to keep ticks on a fixed cadence instead of drifting
+            elapsed = self._loop.time() - started
+            self._poll_interval = max(
+                0.0,
+                self._next_poll_interval()
+                - elapsed
+                + self._jitter.uniform(-POLL_JITTER, POLL_JITTER),
+            )
 
             # Notify subscribed entities
             self.push_update()
 
+        except TimeoutError:
+            _LOG.warning(
+                "[%s] PSN request timed out after %ss, retrying next poll",
+                self.log_id,
+                CALL_TIMEOUT,
+            )
+            self._handle_poll_failure(
+                f"PSN request timed out after {CALL_TIMEOUT}s", backoff=False
+            )
         except PSNAWPAuthenticationError as ex:
             self.psn_authenticated = False
             self.psn_state = media_player.States.UNAVAILABLE
@@ -389,8 +498,74 @@ class PSNAccount(PollingDevice):
             )
         except Exception as ex:  # pylint: disable=broad-exception-caught
             _LOG.error("[%s] Error while polling PSN: %s", self.log_id, ex)
-            self.events.emit(
-                DeviceEvents.ERROR,
-                self.identifier,
+            self._handle_poll_failure(
                 f"Error while polling PSN: {ex}",
+                backoff=isinstance(ex, PSNAWPError),
             )
+
+    def _apply_data(self, data: PlayStationNetworkData | None) -> None:
+        """
+        Derive state and title metadata from PSN data without any network I/O.
+
+        :param data: Latest PSN data, or None to report the account as OFF.
+        """
+        platform = data.platform if data else {}
+        title = data.title_metadata if data else {}
+        np_title_id = title.get("npTitleId")
+
+        is_online = (
+            bool(platform.get("platform")) and platform.get("onlineStatus") == "online"
+        )
+        is_playing = is_online and data.available and np_title_id is not None
+
+        # Determine state based on PSN data
+        self.psn_state = _STATE_TABLE[is_online, is_playing]
+
+        self._state = str(self.psn_state)
+
+        # Update title metadata
+        if np_title_id:
+            fmt = title.get("format") or ""
+            self.psn_media_title = title.get("titleName") or ""
+            self.psn_media_artist = fmt
+
+            artwork_key = _ARTWORK_KEYS.get(fmt)
+            self.psn_media_image_url = (
+                (title.get(artwork_key) or "") if artwork_key else ""
+            )
+        else:
+            # Clear metadata when not playing
+            self.psn_media_title = ""
+            self.psn_media_artist = ""
+            self.psn_media_image_url = ""
+
+    def _handle_poll_failure(self, message: str, *, backoff: bool) -> None:
+        """
+        Keep serving the last good data through a failed poll; report an error once it expires.
+
+        While the data is younger than STALE_DATA_MAX, entities keep their state and
+        the next poll is brought forward so expiry is checked on time. After that,
+        or with no data at all, DeviceEvents.ERROR marks the entities unavailable.
+
+        :param message: Error text emitted with DeviceEvents.ERROR.
+        :param backoff: PSN rejected or failed the request; wait ERROR_POLL_INTERVAL.
+        """
+        interval = ERROR_POLL_INTERVAL if backoff else self._poll_interval
+        if self._psn_data is not None:
+            remaining = STALE_DATA_MAX - (self._loop.time() - self._psn_data_at)
+            if remaining > 0:
+                self._poll_interval = min(
+                    interval, max(ACTIVE_POLL_INTERVAL, remaining)
+                )
+                return
+            _LOG.warning(
+                "[%s] No PSN data for over %ss, reporting unavailable",
+                self.log_id,
+                STALE_DATA_MAX,
+            )
+            self._psn_data = None
+            self._is_on = False
+            self._apply_data(None)
+
+        self._poll_interval = interval
+        self.events.emit(DeviceEvents.ERROR, self.identifier, message)
@@ -47,6 +47,9 @@ class PSNSetupFlow(BaseSetupFlow[PSNConfig]):
     4. Pair with console → store credentials → return PSNConfig.
     """
 
+    # The error-free NPSSO form never changes, so it is built once per process
+    _npsso_form_cache: RequestUserInput | None = None
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._npsso: str = ""
@@ -62,7 +65,9 @@ class PSNSetupFlow(BaseSetupFlow[PSNConfig]):
 
     def get_manual_entry_form(self) -> RequestUserInput:
         """Get the NPSSO token entry form (first step)."""
-        return self._npsso_form()
+        if PSNSetupFlow._npsso_form_cache is None:
+            PSNSetupFlow._npsso_form_cache = self._npsso_form()
+        return PSNSetupFlow._npsso_form_cache
 
     def _npsso_form(self, *, error: str | None = None) -> RequestUserInput:
         """
@@ -140,10 +145,20 @@ class PSNSetupFlow(BaseSetupFlow[PSNConfig]):
                 error="Invalid NPSSO token. Please copy it exactly from the link above."
             )
 
+        loop = self.driver.loop
+
+        def _authenticate():
+            # Not pooled: a rejected or replaced token must not leave a client behind
+            psnawp = PlayStationNetwork(npsso, loop, pooled=False)
+            try:
+                return psnawp.get_user()
+            finally:
+                psnawp.close()
+
         try:
             _LOG.debug("Connecting to PSN API")
-            psnawp = PlayStationNetwork(npsso, self.driver.loop)
-            user = psnawp.get_user()
+            # psnawp authenticates with blocking requests; keep the loop responsive
+            user = await loop.run_in_executor(None, _authenticate)
             _LOG.info("Authenticated PSN Account: %s", user.online_id)
         except Exception as err:
             _LOG.error("Failed to authenticate with PSN: %s", err)